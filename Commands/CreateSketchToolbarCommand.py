@@ -1,3 +1,5 @@
+import importlib
+import os
 import sys
 from pathlib import Path
 
@@ -5,9 +7,30 @@ import FreeCAD
 import FreeCADGui
 from PySide import QtGui, QtCore
 
+# QIcon construction parses and rasterizes the SVG synchronously, so
+# decoded icons are memoized per path.
+_ICON_CACHE = {}
+
+
+def _icon(icon_path: Path) -> QtGui.QIcon:
+    key = str(icon_path)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = QtGui.QIcon(key) if icon_path.exists() else QtGui.QIcon()
+        _ICON_CACHE[key] = icon
+    return icon
+
+
 class CreateSketchToolbarCommand:
     wb_path: Path = Path(__file__).parent.parent
 
+    def __init__(self):
+        self.reprofile_path = self.wb_path / "Macros" / "SketchReProfile"
+        self.wiredoctor_path = self.wb_path / "Macros" / "SketcherWireDoctor"
+        # Macro module name -> mtime of its file at last (re)load, so a
+        # button click only reloads when the file changed on disk.
+        self._macro_mtimes = {}
+
     def GetResources(self):
         return {
             'Pixmap': '',  # No icon
@@ -20,12 +43,9 @@ class CreateSketchToolbarCommand:
             mw = FreeCADGui.getMainWindow()
             toolbar_name = "Detessellate_Sketch_Tools"
 
-            # Check if toolbar already exists
-            existing_toolbar = None
-            for toolbar in mw.findChildren(QtGui.QToolBar):
-                if toolbar.objectName() == toolbar_name:
-                    existing_toolbar = toolbar
-                    break
+            # Check if toolbar already exists (indexed object-name lookup,
+            # no traversal of every toolbar in the main window)
+            existing_toolbar = mw.findChild(QtGui.QToolBar, toolbar_name)
 
             if existing_toolbar:
                 FreeCAD.Console.PrintMessage("Detessellate Sketch Tools toolbar already exists.\n")
@@ -58,26 +78,41 @@ class CreateSketchToolbarCommand:
             traceback.print_exc()
 
     def connect_workbench_toggle(self, toolbar):
-        """Connect to workbench activation to show/hide toolbar"""
+        """Register the toolbar with a single shared workbench dispatcher"""
         try:
             mw = FreeCADGui.getMainWindow()
 
-            # Store reference to toolbar in the main window so the lambda can access it
+            # Store reference to toolbar in the main window so the dispatcher can access it
             if not hasattr(mw, '_detessellate_sketch_toolbars'):
                 mw._detessellate_sketch_toolbars = []
             mw._detessellate_sketch_toolbars.append(toolbar)
 
-            # Create a callback that shows/hides the toolbar
+            # Connect one dispatcher exactly once; reruns of the command only
+            # append to the toolbar list instead of stacking new callbacks.
+            if hasattr(mw, '_detessellate_wb_cb'):
+                return
+
             def on_workbench_changed():
                 try:
                     current_wb = FreeCADGui.activeWorkbench()
                     # More robust check - use class name instead of name() method
                     is_sketcher = current_wb and current_wb.__class__.__name__ == "SketcherWorkbench"
-                    toolbar.setVisible(is_sketcher)
+
+                    # Toggle the surviving toolbars and drop any whose
+                    # underlying QToolBar has been deleted.
+                    alive = []
+                    for tb in mw._detessellate_sketch_toolbars:
+                        try:
+                            tb.setVisible(is_sketcher)
+                            alive.append(tb)
+                        except RuntimeError:
+                            pass
+                    mw._detessellate_sketch_toolbars = alive
                 except Exception as e:
                     FreeCAD.Console.PrintWarning(f"Error in workbench toggle: {e}\n")
 
             # Connect to workbench activated signal
+            mw._detessellate_wb_cb = on_workbench_changed
             mw.workbenchActivated.connect(on_workbench_changed)
 
         except Exception as e:
@@ -86,9 +121,9 @@ class CreateSketchToolbarCommand:
     def add_sketch_reprofile_button(self, toolbar):
         """Add SketchReProfile button that directly calls the macro"""
         try:
-            macro_path = self.wb_path / "Macros" / "SketchReProfile"
+            macro_path = self.reprofile_path
             icon_path = macro_path / "SketchReProfile.svg"
-            icon = QtGui.QIcon(str(icon_path))
+            icon = _icon(icon_path)
 
             action = QtGui.QAction(icon, "Sketch ReProfile", toolbar)
             action.setToolTip(
@@ -106,9 +141,9 @@ class CreateSketchToolbarCommand:
     def add_sketcher_wiredoctor_button(self, toolbar):
         """Add SketcherWireDoctor button that directly calls the macro"""
         try:
-            macro_path = self.wb_path / "Macros" / "SketcherWireDoctor"
+            macro_path = self.wiredoctor_path
             icon_path = macro_path / "SketcherWireDoctor.svg"
-            icon = QtGui.QIcon(str(icon_path))
+            icon = _icon(icon_path)
 
             action = QtGui.QAction(icon, "Sketcher Wire Doctor", toolbar)
             action.setToolTip(
@@ -123,20 +158,31 @@ class CreateSketchToolbarCommand:
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error adding SketcherWireDoctor button: {e}\n")
 
+    def _load_macro_module(self, macro_path: Path, module_name: str):
+        """Import a macro module, reloading it only when its file changed on disk"""
+        if str(macro_path) not in sys.path:
+            sys.path.append(str(macro_path))
+
+        already_loaded = module_name in sys.modules
+        module = importlib.import_module(module_name)
+
+        mtime = os.path.getmtime(macro_path / f"{module_name}.py")
+        cached_mtime = self._macro_mtimes.get(module_name)
+        # Reload whenever the file differs from the stamped mtime (also
+        # when replaced by an older version), or when the module was
+        # already imported elsewhere (e.g. by the menu command) before
+        # this command stamped an mtime for it.
+        if already_loaded and mtime != cached_mtime:
+            module = importlib.reload(module)
+        self._macro_mtimes[module_name] = mtime
+
+        return module
+
     def run_sketch_reprofile(self, macro_path: Path) -> None:
         """Directly run the SketchReProfile macro"""
         try:
-            if str(macro_path) not in sys.path:
-                sys.path.append(str(macro_path))
-
-            import importlib
-            if 'SketchReProfile' in sys.modules:
-                import SketchReProfile
-                importlib.reload(SketchReProfile)
-            else:
-                import SketchReProfile
-
-            SketchReProfile.final_sketcher_main()
+            module = self._load_macro_module(macro_path, 'SketchReProfile')
+            module.final_sketcher_main()
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error running SketchReProfile: {e}\n")
@@ -146,18 +192,10 @@ class CreateSketchToolbarCommand:
     def run_sketcher_wiredoctor(self, macro_path: Path) -> None:
         """Directly run the SketcherWireDoctor macro"""
         try:
-            if str(macro_path) not in sys.path:
-                sys.path.append(str(macro_path))
-
-            import importlib
-            if 'SketcherWireDoctor_Main' in sys.modules:
-                import SketcherWireDoctor_Main
-                importlib.reload(SketcherWireDoctor_Main)
-            else:
-                import SketcherWireDoctor_Main
+            module = self._load_macro_module(macro_path, 'SketcherWireDoctor_Main')
 
             # Call the main function to show the docker
-            SketcherWireDoctor_Main.show_sketcher_wire_doctor()
+            module.show_sketcher_wire_doctor()
 
         except Exception as e:
             FreeCAD.Console.PrintError(f"Error running SketcherWireDoctor: {e}\n")
@@ -1,9 +1,19 @@
+import math
+
 import FreeCAD
 import FreeCADGui
 import Part
 import Sketcher
+import numpy as np
 from PySide.QtWidgets import QInputDialog, QMessageBox
 
+# Shared constants, hoisted so per-edge code does not rebuild them:
+# FreeCAD.Vector construction crosses the C++ boundary on every call.
+_TWO_PI = 2.0 * math.pi
+_Z_AXIS = FreeCAD.Vector(0, 0, 1)
+_ORIGIN = FreeCAD.Vector(0, 0, 0)
+
+
 def edge_loop_to_sketch():
     """
     Creates a parametric sketch from selected edges, preserving curve types.
@@ -46,96 +56,60 @@ def edge_loop_to_sketch():
         # Special case: single edge that defines its own plane
         if len(selected_edges) == 1:
             edge = selected_edges[0]
-            curve_type = type(edge.Curve).__name__
-            
-            if curve_type == 'Circle':
+
+            if isinstance(edge.Curve, Part.Circle):
                 # Circle defines its own plane via its axis
                 circle = edge.Curve
                 plane_normal = circle.Axis.normalize()
                 plane_point = circle.Center
                 FreeCAD.Console.PrintMessage("Using plane from circle geometry.\n")
-            elif curve_type == 'BSplineCurve':
+            elif isinstance(edge.Curve, Part.BSplineCurve):
                 # Check if B-spline is planar by examining control points
                 bspline = edge.Curve
                 poles = bspline.getPoles()
-                
+
                 if len(poles) < 3:
                     raise Exception("B-spline does not have enough control points to define a plane.")
-                
-                # Find 3 non-collinear poles to define plane
-                plane_point = poles[0]
-                
-                for i in range(1, len(poles)):
-                    v1 = poles[i] - plane_point
-                    for j in range(i + 1, len(poles)):
-                        v2 = poles[j] - plane_point
-                        cross = v1.cross(v2)
-                        if cross.Length > tolerance:
-                            plane_normal = cross.normalize()
-                            break
-                    if plane_normal:
-                        break
-                
+
+                try:
+                    plane_point, plane_normal = fit_plane_svd(poles, tolerance)
+                except ValueError:
+                    raise Exception("B-spline is non-planar (3D curve). Select additional edges to define the plane.")
+
                 if not plane_normal:
                     raise Exception("B-spline control points are collinear and cannot define a plane.")
-                
-                # Verify all poles are coplanar
-                for pole in poles:
-                    distance = abs((pole - plane_point).dot(plane_normal))
-                    if distance > tolerance:
-                        raise Exception("B-spline is non-planar (3D curve). Select additional edges to define the plane.")
-                
+
                 FreeCAD.Console.PrintMessage("Using plane from planar B-spline geometry.\n")
             else:
-                raise Exception(f"Single edge of type '{curve_type}' cannot define a plane. Select at least 2 edges.")
+                raise Exception(f"Single edge of type '{type(edge.Curve).__name__}' cannot define a plane. Select at least 2 edges.")
         
         # Multiple edges: validate coplanarity
         if len(selected_edges) >= 2:
-            unique_points = []
             all_points = []
-            
+            # Dedup with rounded coordinate keys (same scheme as the vertex
+            # map in add_vertex_coincident_constraints): O(N) instead of an
+            # isEqual scan over every prior point.
+            seen_keys = set()
             for edge in selected_edges:
                 for vertex in edge.Vertexes:
                     pt = vertex.Point
                     all_points.append(pt)
-                    if not any(pt.isEqual(existing, tolerance) for existing in unique_points):
-                        unique_points.append(pt)
+                    seen_keys.add((round(pt.x, 6), round(pt.y, 6), round(pt.z, 6)))
 
-            if len(unique_points) < 3:
+            if len(seen_keys) < 3:
                 raise Exception("Selected edges do not provide enough unique points to define a plane.")
 
-            # Find 3 non-collinear points to define plane
-            plane_point = unique_points[0]
-            
-            for i in range(1, len(unique_points)):
-                v1 = unique_points[i] - plane_point
-                for j in range(i + 1, len(unique_points)):
-                    v2 = unique_points[j] - plane_point
-                    cross = v1.cross(v2)
-                    if cross.Length > tolerance:
-                        plane_normal = cross.normalize()
-                        break
-                if plane_normal:
-                    break
+            try:
+                plane_point, plane_normal = fit_plane_svd(all_points, tolerance)
+            except ValueError:
+                raise Exception("Selected edges are not coplanar.")
 
             if not plane_normal:
                 raise Exception("Selected edges are collinear and cannot define a plane.")
 
-            # Verify all points are coplanar
-            for pt in all_points:
-                distance = abs((pt - plane_point).dot(plane_normal))
-                if distance > tolerance:
-                    raise Exception("Selected edges are not coplanar.")
-
-        # Calculate placement
-        if len(selected_edges) == 1:
-            # For single circle, use its center
-            center = plane_point
-        else:
-            # For multiple edges, use centroid of all points
-            center = sum(all_points, FreeCAD.Vector()).multiply(1.0 / len(all_points))
-        
-        placement = create_sketch_placement(plane_normal, center)
+        # Calculate placement: fit_plane_svd already returns the point
+        # centroid, and a single circle provides its own center.
+        placement = create_sketch_placement(plane_normal, plane_point)
 
         # Show destination dialog
         choice = show_destination_dialog()
@@ -173,15 +147,36 @@ def edge_loop_to_sketch():
         QMessageBox.critical(None, "Error", f"Sketch creation failed:\n{str(e)}")
 
 
+def fit_plane_svd(points, tolerance):
+    """
+    Fit a plane through points with an SVD of the centered point matrix.
+    The singular vector with the smallest singular value is the plane
+    normal, and the smallest singular value bounds the planarity residual.
+    Returns (plane_point, plane_normal); plane_normal is None when the
+    points are collinear. Raises ValueError when the points are not
+    coplanar within tolerance.
+    """
+    pts = np.array([(p.x, p.y, p.z) for p in points], dtype=np.float64)
+    centroid = pts.mean(axis=0)
+    _, singular_values, vt = np.linalg.svd(pts - centroid, full_matrices=False)
+
+    if singular_values[1] < tolerance:
+        return FreeCAD.Vector(*centroid), None
+
+    if singular_values[2] > tolerance * math.sqrt(len(pts)):
+        raise ValueError("Points are not coplanar within tolerance.")
+
+    return FreeCAD.Vector(*centroid), FreeCAD.Vector(*vt[2])
+
+
 def create_sketch_placement(normal, center):
     """Create placement for sketch from normal and center point."""
-    normal = normal.normalize() if normal.Length > 1e-6 else FreeCAD.Vector(0, 0, 1)
-    z_axis = FreeCAD.Vector(0, 0, 1)
-    
-    if abs(normal.dot(z_axis)) > 0.999:
+    normal = normal.normalize() if normal.Length > 1e-6 else _Z_AXIS
+
+    if abs(normal.dot(_Z_AXIS)) > 0.999:
         rotation = FreeCAD.Rotation() if normal.z > 0 else FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 180)
     else:
-        rotation = FreeCAD.Rotation(z_axis, normal)
+        rotation = FreeCAD.Rotation(_Z_AXIS, normal)
     
     return FreeCAD.Placement(center, rotation)
 
@@ -235,7 +230,9 @@ def create_body_sketch(doc, body, placement, edges):
     sketch.AttachmentOffset.Rotation = placement.Rotation
     sketch.Placement = FreeCAD.Placement()
     
-    doc.recompute()  # Resolve attachment before adding geometry
+    # Resolve attachment before adding geometry; a single-object recompute
+    # is enough and avoids re-evaluating the whole document mid-transaction.
+    sketch.recompute()
     
     inverse_placement = sketch.getGlobalPlacement().inverse()
     add_geometry_to_sketch(sketch, edges, inverse_placement)
@@ -243,85 +240,102 @@ def create_body_sketch(doc, body, placement, edges):
     return sketch
 
 
+def transform_points(matrix, points):
+    """Apply a 4x4 placement matrix to an iterable of points in one matmul."""
+    pts = np.array([(p.x, p.y, p.z) for p in points], dtype=np.float64)
+    local = pts @ matrix[:3, :3].T + matrix[:3, 3]
+    return [FreeCAD.Vector(*row) for row in local]
+
+
 def add_geometry_to_sketch(sketch, edges, inverse_placement):
     """Add geometry to sketch, preserving curve types."""
-    geo_indices = []  # Track created geometry indices with original edges
-    
+    geometries = []
+    source_edges = []  # Original edge for each built geometry
+
+    # Extract the placement matrix once so each edge is transformed with a
+    # single matmul instead of one multVec call per point.
+    matrix = np.array(inverse_placement.Matrix.A, dtype=np.float64).reshape(4, 4)
+
     for edge in edges:
         try:
-            curve_type = type(edge.Curve).__name__
-            
-            if curve_type == 'Line':
-                geo_index = add_line_to_sketch(sketch, edge, inverse_placement)
-            elif curve_type == 'Circle':
-                geo_index = add_circle_to_sketch(sketch, edge, inverse_placement)
-            elif curve_type == 'BSplineCurve':
-                geo_index = add_bspline_to_sketch(sketch, edge, inverse_placement)
-            else:
-                FreeCAD.Console.PrintWarning(f"Unsupported curve type: {curve_type}, converting to line.\n")
-                geo_index = add_line_to_sketch(sketch, edge, inverse_placement)
-            
-            if geo_index is not None:
-                geo_indices.append((geo_index, edge))
-                
+            curve_type = type(edge.Curve)
+            handler = _CURVE_HANDLERS.get(curve_type)
+
+            if handler is None:
+                if curve_type not in _unsupported_curve_types:
+                    _unsupported_curve_types.add(curve_type)
+                    FreeCAD.Console.PrintWarning(f"Unsupported curve type: {curve_type.__name__}, converting to line.\n")
+                handler = make_line_geometry
+
+            geometry = handler(edge, matrix)
+
+            if geometry is not None:
+                geometries.append(geometry)
+                source_edges.append(edge)
+
         except Exception as e:
             FreeCAD.Console.PrintWarning(f"Failed to add edge: {e}\n")
-    
+
+    # One batched addGeometry call inserts everything with a single solver
+    # invocation instead of one recompute per edge.
+    first_geo_idx = sketch.GeometryCount
+    if geometries:
+        sketch.addGeometry(geometries, False)
+
+    geo_indices = [(first_geo_idx + i, edge) for i, edge in enumerate(source_edges)]
+
     # Phase 2: Build constraint data from actual created geometry and apply constraints
     build_constraint_data(sketch, geo_indices)
 
 
-def add_line_to_sketch(sketch, edge, inverse_placement):
-    """Add a line segment to sketch."""
-    v_start = inverse_placement.multVec(edge.Vertexes[0].Point)
-    v_end = inverse_placement.multVec(edge.Vertexes[-1].Point)
-    
-    geo_index = sketch.addGeometry(Part.LineSegment(v_start, v_end), False)
-    return geo_index
+def make_line_geometry(edge, matrix):
+    """Build a line segment from an edge."""
+    # Bind Vertexes once: the property rebuilds its list on every access
+    vertexes = edge.Vertexes
+    v_start, v_end = transform_points(matrix, (vertexes[0].Point, vertexes[-1].Point))
+
+    return Part.LineSegment(v_start, v_end)
 
 
-def add_circle_to_sketch(sketch, edge, inverse_placement):
-    """Add a circle or arc to sketch."""
+def make_circle_geometry(edge, matrix):
+    """Build a circle or arc from an edge."""
     circle = edge.Curve
-    center_local = inverse_placement.multVec(circle.Center)
-    
+
     # Check if it's a full circle or an arc
     arc_length = edge.Length
-    full_circle_length = 2 * 3.141592653589793 * circle.Radius
-    
+    full_circle_length = _TWO_PI * circle.Radius
+
     if abs(arc_length - full_circle_length) < 0.01:
         # Full circle
-        geo_index = sketch.addGeometry(Part.Circle(center_local, FreeCAD.Vector(0, 0, 1), circle.Radius), False)
-    else:
-        # Arc - use 3 points
-        v_start = inverse_placement.multVec(edge.Vertexes[0].Point)
-        v_end = inverse_placement.multVec(edge.Vertexes[-1].Point)
-        
-        # Get midpoint on arc
-        param_range = edge.ParameterRange
-        mid_param = (param_range[0] + param_range[1]) / 2
-        mid_point_global = edge.valueAt(mid_param)
-        v_mid = inverse_placement.multVec(mid_point_global)
-        
-        geo_index = sketch.addGeometry(Part.ArcOfCircle(v_start, v_mid, v_end), False)
-    
-    return geo_index
+        center_local, = transform_points(matrix, (circle.Center,))
+        return Part.Circle(center_local, _Z_AXIS, circle.Radius)
+
+    # Arc - use 3 points: start, midpoint on arc, end
+    param_range = edge.ParameterRange
+    mid_param = (param_range[0] + param_range[1]) / 2
+    mid_point_global = edge.valueAt(mid_param)
+
+    vertexes = edge.Vertexes
+    v_start, v_mid, v_end = transform_points(
+        matrix, (vertexes[0].Point, mid_point_global, vertexes[-1].Point))
 
+    return Part.ArcOfCircle(v_start, v_mid, v_end)
 
-def add_bspline_to_sketch(sketch, edge, inverse_placement):
-    """Add a B-spline to sketch."""
+
+def make_bspline_geometry(edge, matrix):
+    """Build a B-spline from an edge."""
     bspline = edge.Curve
-    
+
     # Get control points (poles)
     poles = bspline.getPoles()
-    poles_local = [inverse_placement.multVec(p) for p in poles]
-    
+    poles_local = transform_points(matrix, poles)
+
     # Get knots and multiplicities
     knots = bspline.getKnots()
     mults = bspline.getMultiplicities()
     degree = bspline.Degree
     periodic = bspline.isPeriodic()
-    
+
     # Create B-spline curve
     bspline_local = Part.BSplineCurve()
     bspline_local.buildFromPolesMultsKnots(
@@ -331,195 +345,170 @@ def add_bspline_to_sketch(sketch, edge, inverse_placement):
         periodic,
         degree
     )
-    
-    geo_index = sketch.addGeometry(bspline_local, False)
-    return geo_index
+
+    return bspline_local
+
+
+# Dispatch table for add_geometry_to_sketch, looked up by curve type.
+_CURVE_HANDLERS = {
+    Part.Line: make_line_geometry,
+    Part.Circle: make_circle_geometry,
+    Part.BSplineCurve: make_bspline_geometry,
+}
+
+# Curve types already reported as unsupported, so each is warned about once.
+_unsupported_curve_types = set()
 
 
 def build_constraint_data(sketch, geo_indices):
     """
     Query actual geometry from sketch and build accurate constraint maps.
     This approach is geometry-agnostic and handles any future types.
+    Classification runs in a single sweep over a cached copy of
+    sketch.Geometry instead of one property fetch per constraint pass.
     """
+    geos = list(sketch.Geometry)
+
+    vertex_map = {}        # Maps rounded coordinates to list of (geo_idx, vertex_id)
+    center_entries = []    # (geo_idx, center) for arcs and circles
+    radius_entries = []    # (geo_idx, radius) for arcs and circles
+    distance_entries = []  # (geo_idx, length) for straight lines
+
+    for geo_idx, original_edge in geo_indices:
+        geo = geos[geo_idx]
+        is_full_circle = isinstance(geo, Part.Circle)
+
+        if is_full_circle or isinstance(geo, Part.ArcOfCircle):
+            center_entries.append((geo_idx, geo.Center))
+            radius_entries.append((geo_idx, geo.Radius))
+
+        # Full circles have no vertices to constrain; get vertices from
+        # geometry that has them
+        if not is_full_circle and hasattr(geo, 'StartPoint') and hasattr(geo, 'EndPoint'):
+            # Use sketch.getPoint() to get actual vertex coordinates
+            # StartPoint/EndPoint are NOT reliable for vertex numbering!
+            try:
+                vertex1 = sketch.getPoint(geo_idx, 1)
+                vertex2 = sketch.getPoint(geo_idx, 2)
+
+                # Round coordinates for matching
+                v1_key = (round(vertex1.x, 6), round(vertex1.y, 6), round(vertex1.z, 6))
+                v2_key = (round(vertex2.x, 6), round(vertex2.y, 6), round(vertex2.z, 6))
+
+                # Store in vertex map
+                vertex_map.setdefault(v1_key, []).append((geo_idx, 1))
+                vertex_map.setdefault(v2_key, []).append((geo_idx, 2))
+
+                if isinstance(geo, Part.LineSegment):
+                    distance_entries.append((geo_idx, vertex1.distanceToPoint(vertex2)))
+
+            except Exception as e:
+                FreeCAD.Console.PrintWarning(f"Could not get points for geometry[{geo_idx}]: {e}\n")
+
     # Step 1: Add coincident constraints FIRST (while geometry can still move)
-    add_vertex_coincident_constraints(sketch, geo_indices)
-    
+    add_vertex_coincident_constraints(sketch, vertex_map)
+
     # Step 2: Add construction lines from arc/circle centers to origin
-    add_center_construction_lines(sketch, geo_indices)
-    
+    add_center_construction_lines(sketch, center_entries)
+
     # Step 3: Add radius constraints to all arcs and circles
-    add_radius_constraints(sketch, geo_indices)
-    
+    add_radius_constraints(sketch, radius_entries)
+
     # Step 4: Add reference distance constraints to all lines
-    add_line_distance_constraints(sketch, geo_indices)
+    add_line_distance_constraints(sketch, distance_entries)
 
 
-def add_center_construction_lines(sketch, geo_indices):
+def add_center_construction_lines(sketch, center_entries):
     """
     Add construction lines from arc/circle centers to sketch origin.
     These lines are coincident-constrained at both ends and prevent geometry from flipping.
     """
-    origin = FreeCAD.Vector(0, 0, 0)
-    construction_line_count = 0
-    construction_line_indices = []
+    lines = []
+    anchored_geo_indices = []  # Geometry index whose center each line anchors
+    constraints = []
     tolerance = 1e-6
-    
-    for geo_idx, original_edge in geo_indices:
-        geo = sketch.Geometry[geo_idx]
-        
-        # Check if this is an arc or circle
-        if isinstance(geo, Part.ArcOfCircle):
-            center = geo.Center
-            distance_to_origin = center.Length
-            
-            # Only create construction line if center is not at origin
-            if distance_to_origin > tolerance:
-                # Add construction line from center to origin
-                line = Part.LineSegment(center, origin)
-                line_idx = sketch.addGeometry(line, True)  # True = construction mode
-                
-                # Coincident constraint: line start to arc center
-                sketch.addConstraint(Sketcher.Constraint('Coincident', line_idx, 1, geo_idx, 3))
-                
-                # Coincident constraint: line end to origin
-                sketch.addConstraint(Sketcher.Constraint('Coincident', line_idx, 2, -1, 1))
-                
-                construction_line_indices.append(line_idx)
-                construction_line_count += 1
-            else:
-                # Center is already at origin - just constrain it directly
-                sketch.addConstraint(Sketcher.Constraint('Coincident', geo_idx, 3, -1, 1))
-            
-        elif isinstance(geo, Part.Circle):
-            center = geo.Center
-            distance_to_origin = center.Length
-            
-            # Only create construction line if center is not at origin
-            if distance_to_origin > tolerance:
-                # Add construction line from center to origin
-                line = Part.LineSegment(center, origin)
-                line_idx = sketch.addGeometry(line, True)  # True = construction mode
-                
-                # Coincident constraint: line start to circle center
-                sketch.addConstraint(Sketcher.Constraint('Coincident', line_idx, 1, geo_idx, 3))
-                
-                # Coincident constraint: line end to origin
-                sketch.addConstraint(Sketcher.Constraint('Coincident', line_idx, 2, -1, 1))
-                
-                construction_line_indices.append(line_idx)
-                construction_line_count += 1
-            else:
-                # Center is already at origin - just constrain it directly
-                sketch.addConstraint(Sketcher.Constraint('Coincident', geo_idx, 3, -1, 1))
-    
-    # Block constrain all construction lines to prevent rotation/movement
-    for line_idx in construction_line_indices:
-        sketch.addConstraint(Sketcher.Constraint('Block', line_idx))
-    
-    # FreeCAD.Console.PrintMessage(f"Added {construction_line_count} center construction lines with block constraints.\n")
 
+    for geo_idx, center in center_entries:
+        # Only create construction line if center is not at origin
+        if center.Length > tolerance:
+            lines.append(Part.LineSegment(center, _ORIGIN))
+            anchored_geo_indices.append(geo_idx)
+        else:
+            # Center is already at origin - just constrain it directly
+            constraints.append(Sketcher.Constraint('Coincident', geo_idx, 3, -1, 1))
+
+    # Add all construction lines in one batched call (True = construction mode)
+    first_line_idx = sketch.GeometryCount
+    if lines:
+        sketch.addGeometry(lines, True)
+
+    for offset, geo_idx in enumerate(anchored_geo_indices):
+        line_idx = first_line_idx + offset
 
-def add_radius_constraints(sketch, geo_indices):
+        # Coincident constraints: line start to center, line end to origin
+        constraints.append(Sketcher.Constraint('Coincident', line_idx, 1, geo_idx, 3))
+        constraints.append(Sketcher.Constraint('Coincident', line_idx, 2, -1, 1))
+
+        # Block constrain the construction line to prevent rotation/movement
+        constraints.append(Sketcher.Constraint('Block', line_idx))
+
+    if constraints:
+        sketch.addConstraint(constraints)
+
+    # FreeCAD.Console.PrintMessage(f"Added {len(lines)} center construction lines with block constraints.\n")
+
+
+def add_radius_constraints(sketch, radius_entries):
     """
     Add radius constraints to all arcs and circles to lock their size.
     """
-    radius_constraint_count = 0
-    
-    for geo_idx, original_edge in geo_indices:
-        geo = sketch.Geometry[geo_idx]
-        
-        # Check if this is an arc or circle
-        if isinstance(geo, Part.ArcOfCircle):
-            radius = geo.Radius
-            sketch.addConstraint(Sketcher.Constraint('Radius', geo_idx, radius))
-            radius_constraint_count += 1
-            
-        elif isinstance(geo, Part.Circle):
-            radius = geo.Radius
-            sketch.addConstraint(Sketcher.Constraint('Radius', geo_idx, radius))
-            radius_constraint_count += 1
-    
-    # FreeCAD.Console.PrintMessage(f"Added {radius_constraint_count} radius constraints.\n")
+    constraints = [Sketcher.Constraint('Radius', geo_idx, radius)
+                   for geo_idx, radius in radius_entries]
 
+    if constraints:
+        sketch.addConstraint(constraints)
 
-def add_vertex_coincident_constraints(sketch, geo_indices):
+    # FreeCAD.Console.PrintMessage(f"Added {len(constraints)} radius constraints.\n")
+
+
+def add_vertex_coincident_constraints(sketch, vertex_map):
     """
-    Add coincident constraints at shared vertices by matching actual vertex coordinates.
-    Uses sketch.getPoint() to get the actual vertex positions, not StartPoint/EndPoint.
+    Add coincident constraints at shared vertices from the vertex map
+    built in build_constraint_data.
     """
-    tolerance = 1e-6
-    vertex_map = {}  # Maps rounded coordinates to list of (geo_idx, vertex_id)
-    
-    for geo_idx, original_edge in geo_indices:
-        geo = sketch.Geometry[geo_idx]
-        
-        # Skip full circles (no vertices to constrain)
-        if isinstance(geo, Part.Circle):
-            continue
-        
-        # Get vertices from geometry that has them
-        if hasattr(geo, 'StartPoint') and hasattr(geo, 'EndPoint'):
-            # Use sketch.getPoint() to get actual vertex coordinates
-            # StartPoint/EndPoint are NOT reliable for vertex numbering!
-            try:
-                vertex1 = sketch.getPoint(geo_idx, 1)
-                vertex2 = sketch.getPoint(geo_idx, 2)
-                
-                # Round coordinates for matching
-                v1_key = (round(vertex1.x, 6), round(vertex1.y, 6), round(vertex1.z, 6))
-                v2_key = (round(vertex2.x, 6), round(vertex2.y, 6), round(vertex2.z, 6))
-                
-                # Store in vertex map
-                vertex_map.setdefault(v1_key, []).append((geo_idx, 1))
-                vertex_map.setdefault(v2_key, []).append((geo_idx, 2))
-                
-            except Exception as e:
-                FreeCAD.Console.PrintWarning(f"Could not get points for geometry[{geo_idx}]: {e}\n")
-    
-    # Find and create coincident constraints for matching vertices
-    constraint_count = 0
-    
+    # Create the full star of coincident constraints at each shared vertex
+    # (base to every other occurrence, not just the first pair) and submit
+    # them in a single batched call.
+    constraints = []
+
     for coord_key, vertex_list in vertex_map.items():
         if len(vertex_list) > 1:
-            # Create constraints between all pairs (for now just first to second)
             base = vertex_list[0]
-            other = vertex_list[1]
-            
-            try:
-                sketch.addConstraint(Sketcher.Constraint('Coincident', base[0], base[1], other[0], other[1]))
-                constraint_count += 1
-            except Exception as e:
-                FreeCAD.Console.PrintWarning(f"Failed to constrain geo[{base[0]}] vertex {base[1]} to geo[{other[0]}] vertex {other[1]}: {e}\n")
-    
-    # FreeCAD.Console.PrintMessage(f"Added {constraint_count} coincident constraints.\n")
+            for other in vertex_list[1:]:
+                constraints.append(Sketcher.Constraint('Coincident', base[0], base[1], other[0], other[1]))
+
+    if constraints:
+        sketch.addConstraint(constraints)
 
+    # FreeCAD.Console.PrintMessage(f"Added {len(constraints)} coincident constraints.\n")
 
-def add_line_distance_constraints(sketch, geo_indices):
+
+def add_line_distance_constraints(sketch, distance_entries):
     """
     Add reference distance constraints to all straight lines.
     Reference constraints are non-driving (informational only).
     """
-    distance_constraint_count = 0
-    
-    for geo_idx, original_edge in geo_indices:
-        geo = sketch.Geometry[geo_idx]
-        
-        # Check if this is a line segment
-        if isinstance(geo, Part.LineSegment):
-            # Calculate distance
-            p1 = sketch.getPoint(geo_idx, 1)
-            p2 = sketch.getPoint(geo_idx, 2)
-            distance = p1.distanceToPoint(p2)
-            
-            # Add reference distance constraint (driving=False makes it reference-only)
-            constraint = Sketcher.Constraint('Distance', geo_idx, distance)
-            constraint_idx = sketch.addConstraint(constraint)
-            
-            # Set constraint to reference mode (non-driving)
+    constraints = [Sketcher.Constraint('Distance', geo_idx, distance)
+                   for geo_idx, distance in distance_entries]
+
+    if constraints:
+        constraint_indices = sketch.addConstraint(constraints)
+
+        # Set constraints to reference mode (driving=False makes them reference-only)
+        for constraint_idx in constraint_indices:
             sketch.setDriving(constraint_idx, False)
-            distance_constraint_count += 1
-    
-    # FreeCAD.Console.PrintMessage(f"Added {distance_constraint_count} reference distance constraints.\n")
+
+    # FreeCAD.Console.PrintMessage(f"Added {len(constraints)} reference distance constraints.\n")
 
 
 # Run the macro